@@ -1,8 +1,25 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, Scale
+try:
+    import tkinter as tk
+    from tkinter import ttk, messagebox, filedialog, Scale
+except ImportError: # --export and --replicate run without Tk
+    tk = ttk = messagebox = filedialog = Scale = None
 import collections
 import time
 import random
+import argparse
+import asyncio
+import bisect
+import concurrent.futures
+import heapq
+import json
+import math
+import os
+import queue
+import statistics
+import struct
+import threading
+import zlib
+from xml.sax.saxutils import escape
 CANVAS_WIDTH = 800
 CANVAS_HEIGHT = 600
 CORE_AREA_Y_START = 100
@@ -12,6 +29,43 @@ QUEUE_AREA_HEIGHT = 150
 PROCESS_RADIUS = 15
 ANIMATION_STEP_DELAY_MS = 1000 
 ANIMATION_MOVE_STEPS = 30
+GANTT_X_START = 50
+GANTT_BAR_HEIGHT = 20
+GANTT_TIME_SCALE = 15 # Pixels per time unit
+GANTT_PADDING = 5
+PROCESS_COLORS = ["red", "blue", "green", "orange", "purple", "brown", "pink", "cyan", "magenta", "yellow", "lime", "teal"]
+COLOR_HEX = { # Tk's values for the color names used on the canvas
+    "red": "#ff0000", "blue": "#0000ff", "green": "#00ff00", "orange": "#ffa500",
+    "purple": "#a020f0", "brown": "#a52a2a", "pink": "#ffc0cb", "cyan": "#00ffff",
+    "magenta": "#ff00ff", "yellow": "#ffff00", "lime": "#00ff00", "teal": "#008080",
+    "gray": "#bebebe", "steelblue": "#4682b4",
+}
+EXPORT_MAX_WIDTH = 4000 # Max Gantt columns in an exported chart
+EXPORT_MARGIN_TOP = 40
+EXPORT_MARGIN_RIGHT = 120
+EXPORT_UTILIZATION_HEIGHT = 40
+EXPORT_MIN_TICK_GAP = 40 # Pixels between time axis labels
+METRIC_NAMES = ("Average Waiting Time", "Average Turnaround Time", "CPU Utilization")
+MC_CI_WIDTH = 0.02 # Stop once each 95% CI is narrower than 2% of its mean
+MC_BATCH_SIZE = 32
+MC_MIN_REPLICATIONS = 10
+MC_MAX_REPLICATIONS = 10000
+T_95 = ( # Two-sided 95% Student t quantiles for 1..30 degrees of freedom
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+Z_975 = 1.959963984540054 # Standard normal 97.5% quantile, the limit of T_95
+CHECKPOINT_INTERVAL = 64 # Time units between scheduler checkpoints kept for workload edits
+LIVE_INGEST_QUEUE_SIZE = 1000 # Pending submissions before the server stops reading
+LIVE_INGEST_BATCH_SIZE = 50 # Max submissions admitted per simulation step
+LIVE_TIME_MODES = ("wallclock", "timestamp")
+LIVE_TIME_UNITS_PER_S = 1.0 # Simulated time units per wall-clock second in wallclock mode
+PROCESS_LIST_SORT_KEYS = {
+    "Order": None, # Process list order, no index needed
+    "Arrival": lambda p: p.arrival_time,
+    "Burst": lambda p: p.burst_time,
+}
 
 class Process:
     """Represents a process with its properties and visual representation."""
@@ -81,8 +135,1024 @@ class Process:
     def __repr__(self):
         return f"P{self.id} (AT:{self.arrival_time}, BT:{self.burst_time})"
 
+def parse_listen_address(address):
+    """Parses 'unix:/path/to.sock', 'tcp://host:port' or 'host:port' into a (kind, target) pair."""
+    if address.startswith("unix:"):
+        path = address[len("unix:"):]
+        if not path:
+            raise ValueError("Unix socket address needs a path.")
+        return "unix", path
+    if address.startswith("tcp://"):
+        address = address[len("tcp://"):]
+    host, sep, port = address.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Expected host:port, got '{address}'.")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+def parse_submission(line):
+    """Parses one newline-delimited JSON job submission into (arrival_time, burst_time).
+
+    arrival_time is None when the submission does not carry a timestamp.
+    """
+    data = json.loads(line)
+    if not isinstance(data, dict):
+        raise ValueError("Submission must be a JSON object.")
+    burst_time = data.get("burst_time")
+    arrival_time = data.get("arrival_time")
+    if not isinstance(burst_time, int) or isinstance(burst_time, bool) or burst_time <= 0:
+        raise ValueError("burst_time must be a positive integer.")
+    if arrival_time is not None and (not isinstance(arrival_time, int) or isinstance(arrival_time, bool) or arrival_time < 0):
+        raise ValueError("arrival_time must be an integer >= 0.")
+    return arrival_time, burst_time
+
+def read_trace(path):
+    """Yields (arrival_time, burst_time) pairs from a trace file.
+
+    Lines are either 'arrival_time,burst_time' (an optional header line is skipped)
+    or JSON objects in the live-ingest format. Blank lines and '#' comments are ignored.
+    """
+    with open(path) as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                try:
+                    arrival_time, burst_time = parse_submission(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_no}: {e}") from None
+                yield (arrival_time or 0), burst_time
+                continue
+            fields = line.split(",")
+            try:
+                arrival_time, burst_time = int(fields[0]), int(fields[1])
+            except (ValueError, IndexError):
+                if line_no == 1:
+                    continue # Header
+                raise ValueError(f"{path}:{line_no}: expected 'arrival_time,burst_time', got '{line}'") from None
+            if arrival_time < 0 or burst_time <= 0:
+                raise ValueError(f"{path}:{line_no}: arrival time must be >= 0 and burst time must be > 0.")
+            yield arrival_time, burst_time
+
+class RRSimulationEngine:
+    """Runs the Round Robin schedule without a GUI.
+
+    Each step follows the same rules as RRSchedulerApp.simulasi_langkah: arrivals join
+    the ready queue, running processes execute one time unit, freed cores take processes
+    from the front of the queue, and preempted processes rejoin the queue last. A process
+    assigned to a core at time t starts executing at t + 1. `workload` is a list of
+    (arrival_time, burst_time) pairs; process ids default to their 1-based positions.
+
+    With a `checkpoint_interval` the engine records the scheduler state every that many
+    time units (or every as many units as there are active processes, if more), which lets
+    apply_edit() re-simulate only the part of the run an edit touches.
+    """
+    def __init__(self, workload, time_quantum, num_cores, on_slice=None, keep_gantt=True,
+                 pids=None, checkpoint_interval=None):
+        if checkpoint_interval and not keep_gantt:
+            raise ValueError("checkpoint_interval needs keep_gantt=True; edits rewrite the Gantt data.")
+        pids = list(pids) if pids is not None else list(range(1, len(workload) + 1))
+        self.arrival_times = {pid: arrival_time for pid, (arrival_time, _) in zip(pids, workload)}
+        self.burst_times = {pid: burst_time for pid, (_, burst_time) in zip(pids, workload)}
+        self.time_quantum = time_quantum
+        self.num_cores = num_cores
+        self.on_slice = on_slice # Called with each finished (p_id, core_id, start, end) bar
+        self.arrival_order = sorted(pids, key=lambda pid: (self.arrival_times[pid], pid)) # Like start_simulation
+        self.sorted_arrivals = [self.arrival_times[pid] for pid in self.arrival_order]
+        self.checkpoint_interval = checkpoint_interval
+
+        self.remaining_burst_times = {} # Only arrived, unfinished processes
+        self.start_times = {}
+        self.completion_times = {}
+        self.start_log = [] # pids in the order their start/completion times were set
+        self.completion_log = []
+        self.next_arrival = 0 # Index into arrival_order
+        self.ready_queue = collections.deque()
+        self.core_processes = [None] * num_cores # pid per core
+        self.core_quantum_used = [0] * num_cores
+        self.open_entries = [None] * num_cores # Gantt bar each core may still extend
+        self.open_entry_indexes = [None] * num_cores # Their positions in gantt_data
+        self.gantt_data = [] if keep_gantt else None
+        self.busy_time = 0
+        self.total_turnaround_time = 0
+        self.terminated_count = 0
+        self.current_time = 0
+        self.checkpoints = []
+        self.next_checkpoint_time = 0
+        self.gantt_changes = [] # (removed bars, added bars) per re-simulated window of the last edit
+        self.finished = not workload
+
+    def step(self):
+        """Simulates one time unit; afterwards current_time is the next step to run."""
+        t = self.current_time
+        if self.checkpoint_interval and t >= self.next_checkpoint_time:
+            self.checkpoints.append(self._checkpoint())
+            # A checkpoint copies every active process, so a backlog spreads them out
+            self.next_checkpoint_time = t + max(self.checkpoint_interval, len(self.remaining_burst_times))
+
+        arrival_order = self.arrival_order
+        while self.next_arrival < len(arrival_order) and self.sorted_arrivals[self.next_arrival] <= t:
+            pid = arrival_order[self.next_arrival]
+            self.remaining_burst_times[pid] = self.burst_times[pid]
+            self.ready_queue.append(pid)
+            self.next_arrival += 1
+
+        preempted = []
+        for core_id, pid in enumerate(self.core_processes):
+            if pid is None:
+                continue
+            entry = self.open_entries[core_id]
+            if entry and entry[0] == pid and entry[3] == t:
+                entry[3] = t + 1
+            else:
+                if entry and self.on_slice:
+                    self.on_slice(*entry)
+                entry = [pid, core_id, t, t + 1]
+                self.open_entries[core_id] = entry
+                if self.gantt_data is not None:
+                    self.open_entry_indexes[core_id] = len(self.gantt_data)
+                    self.gantt_data.append(entry)
+            self.busy_time += 1
+            self.remaining_burst_times[pid] -= 1
+            self.core_quantum_used[core_id] += 1
+
+            if self.remaining_burst_times[pid] <= 0:
+                del self.remaining_burst_times[pid]
+                self.completion_times[pid] = t + 1
+                self.completion_log.append(pid)
+                self.total_turnaround_time += t + 1 - self.arrival_times[pid]
+                self.terminated_count += 1
+                self.core_processes[core_id] = None
+            elif self.core_quantum_used[core_id] >= self.time_quantum:
+                preempted.append(pid)
+                self.core_processes[core_id] = None
+
+        for core_id in range(self.num_cores):
+            if not self.ready_queue:
+                break
+            if self.core_processes[core_id] is None:
+                pid = self.ready_queue.popleft()
+                self.core_processes[core_id] = pid
+                self.core_quantum_used[core_id] = 0
+                if self.remaining_burst_times[pid] == self.burst_times[pid]: # Never ran before
+                    self.start_times[pid] = t
+                    self.start_log.append(pid)
+        self.ready_queue.extend(preempted)
+
+        if self.terminated_count == len(self.burst_times):
+            self.finished = True
+            self._flush_open_entries()
+            return
+        if self.ready_queue or any(pid is not None for pid in self.core_processes):
+            self.current_time = t + 1
+        else: # Nothing happens until the next arrival
+            self.current_time = max(t + 1, self.sorted_arrivals[self.next_arrival])
+
+    def _flush_open_entries(self):
+        for core_id, entry in enumerate(self.open_entries):
+            if entry and self.on_slice:
+                self.on_slice(*entry)
+            self.open_entries[core_id] = None
+
+    def run(self):
+        """Steps until every process has terminated and returns self."""
+        while not self.finished:
+            self.step()
+        return self
+
+    def metrics(self):
+        """Returns (avg waiting, avg turnaround, CPU utilization %) like RRSchedulerApp._compute_metrics."""
+        if not self.terminated_count:
+            return 0, 0, 0
+        if self.finished:
+            total_burst_time = self.busy_time # Every burst has fully run
+        else:
+            total_burst_time = sum(self.burst_times[pid] for pid in self.completion_times)
+        total_possible_time = self.current_time * self.num_cores
+        cpu_utilization = (self.busy_time / total_possible_time) * 100 if total_possible_time > 0 else 0
+        return ((self.total_turnaround_time - total_burst_time) / self.terminated_count,
+                self.total_turnaround_time / self.terminated_count, cpu_utilization)
+
+    def _checkpoint(self):
+        """Captures the state at the start of the current step, in time and memory proportional
+        to the active processes. step() leaves at least that many time units until the next one,
+        so all checkpoints together stay within O(run length)."""
+        return {
+            'time': self.current_time,
+            'ready_queue': tuple(self.ready_queue),
+            'core_processes': tuple(self.core_processes),
+            'core_quantum_used': tuple(self.core_quantum_used),
+            'remaining_burst_times': dict(self.remaining_burst_times),
+            'open_entries': tuple((index, entry[0], entry[3]) if entry else None
+                                  for index, entry in zip(self.open_entry_indexes, self.open_entries)),
+            'gantt_length': len(self.gantt_data),
+            'start_log_length': len(self.start_log),
+            'completion_log_length': len(self.completion_log),
+            'busy_time': self.busy_time,
+            'total_turnaround_time': self.total_turnaround_time,
+            'terminated_count': self.terminated_count,
+        }
+
+    def _matches(self, checkpoint):
+        """Tells whether the current state equals `checkpoint`, so the runs agree from here on."""
+        if (tuple(self.core_processes) != checkpoint['core_processes']
+                or tuple(self.core_quantum_used) != checkpoint['core_quantum_used']
+                or tuple(self.ready_queue) != checkpoint['ready_queue']
+                or self.remaining_burst_times != checkpoint['remaining_burst_times']):
+            return False
+        for entry, saved in zip(self.open_entries, checkpoint['open_entries']):
+            if (entry and (entry[0], entry[3])) != (saved and saved[1:]):
+                return False
+        return True
+
+    def _restore(self, checkpoint, old_gantt_data):
+        """Rewinds the run to `checkpoint` (None means time 0) and returns the gantt_data indexes
+        of the bars it reopened. Start and completion times set after it stay in their dicts
+        until the caller knows which ones the new run replaces."""
+        checkpoint = checkpoint or {
+            'time': 0, 'ready_queue': (), 'core_processes': (None,) * self.num_cores,
+            'core_quantum_used': (0,) * self.num_cores, 'remaining_burst_times': {},
+            'open_entries': (None,) * self.num_cores, 'gantt_length': 0, 'start_log_length': 0,
+            'completion_log_length': 0, 'busy_time': 0, 'total_turnaround_time': 0, 'terminated_count': 0,
+        }
+        self.start_log = self.start_log[:checkpoint['start_log_length']]
+        self.completion_log = self.completion_log[:checkpoint['completion_log_length']]
+
+        self.gantt_data = old_gantt_data[:checkpoint['gantt_length']]
+        reopened = []
+        for core_id, saved in enumerate(checkpoint['open_entries']):
+            if saved:
+                index, pid, end = saved
+                reopened.append(index)
+                entry = [pid, core_id, old_gantt_data[index][2], end] # The old entry may have grown since
+                self.gantt_data[index] = entry
+                self.open_entries[core_id] = entry
+                self.open_entry_indexes[core_id] = index
+            else:
+                self.open_entries[core_id] = None
+                self.open_entry_indexes[core_id] = None
+
+        self.current_time = checkpoint['time']
+        self.ready_queue = collections.deque(checkpoint['ready_queue'])
+        self.core_processes = list(checkpoint['core_processes'])
+        self.core_quantum_used = list(checkpoint['core_quantum_used'])
+        self.remaining_burst_times = dict(checkpoint['remaining_burst_times'])
+        self.busy_time = checkpoint['busy_time']
+        self.total_turnaround_time = checkpoint['total_turnaround_time']
+        self.terminated_count = checkpoint['terminated_count']
+        self.next_arrival = bisect.bisect_left(self.sorted_arrivals, self.current_time)
+        self.next_checkpoint_time = self.current_time
+        self.finished = not self.burst_times
+        return reopened
+
+    def _remove_from_order(self, pid):
+        position = bisect.bisect_left(self.sorted_arrivals, self.arrival_times[pid])
+        while self.arrival_order[position] != pid:
+            position += 1
+        del self.arrival_order[position]
+        del self.sorted_arrivals[position]
+
+    def _insert_into_order(self, pid):
+        arrival_time = self.arrival_times[pid]
+        low = bisect.bisect_left(self.sorted_arrivals, arrival_time)
+        high = bisect.bisect_right(self.sorted_arrivals, arrival_time)
+        position = low + bisect.bisect_left(self.arrival_order[low:high], pid) # Ties go by pid
+        self.arrival_order.insert(position, pid)
+        self.sorted_arrivals.insert(position, arrival_time)
+
+    def apply_edit(self, pid, arrival_time=None, burst_time=None):
+        """Adds or changes process `pid` (arrival and burst given) or removes it (neither given)
+        in a finished run, leaving the engine as if the edited workload had been run from scratch.
+        Returns the pids whose start or completion time may have changed; gantt_changes then
+        lists the Gantt bars the edit removed and added, in the order they were replaced.
+        """
+        if not self.finished or not self.checkpoint_interval:
+            raise ValueError("apply_edit needs a finished run with checkpoints.")
+        self.gantt_changes = []
+        return self._apply_edit(pid, arrival_time, burst_time)
+
+    def _apply_edit(self, pid, arrival_time, burst_time):
+        """Applies one edit for apply_edit().
+
+        The run resumes from the last checkpoint before the edit. After the arrival time,
+        re-simulation stops at the first checkpoint of the previous run whose state matches,
+        and the rest of that run is reused. Moving a process's arrival is applied as a removal
+        and an addition, so each is local to its own arrival time.
+        """
+        old_arrival_time = self.arrival_times.get(pid)
+        if old_arrival_time is None and arrival_time is None:
+            raise KeyError(pid)
+        if old_arrival_time is not None and arrival_time is not None and arrival_time != old_arrival_time:
+            return self._apply_edit(pid, None, None) | self._apply_edit(pid, arrival_time, burst_time)
+        if old_arrival_time is not None:
+            self._remove_from_order(pid)
+            del self.arrival_times[pid]
+            del self.burst_times[pid]
+        if arrival_time is not None:
+            self.arrival_times[pid] = arrival_time
+            self.burst_times[pid] = burst_time
+            self._insert_into_order(pid)
+        edit_time = old_arrival_time if arrival_time is None else arrival_time # Both runs agree on arrivals after it
+
+        old_gantt_data = self.gantt_data
+        old_checkpoints = self.checkpoints
+        old_start_log = self.start_log
+        old_completion_log = self.completion_log
+        old_start_time = self.start_times.get(pid)
+        old_final = (self.current_time, self.busy_time, self.total_turnaround_time, self.terminated_count)
+
+        times = [checkpoint['time'] for checkpoint in old_checkpoints]
+        resume = bisect.bisect_right(times, edit_time) - 1
+        self.checkpoints = old_checkpoints[:max(resume, 0)]
+        reopened = self._restore(old_checkpoints[resume] if resume >= 0 else None, old_gantt_data)
+        resumed_gantt_length = len(self.gantt_data)
+        resumed_start_log_length = len(self.start_log)
+        resumed_completion_log_length = len(self.completion_log)
+        if self.finished or self.terminated_count == len(self.burst_times): # Nothing left to run
+            if self.finished:
+                self.current_time = 0
+            else: # The edited run was already over by then
+                self.current_time = self.completion_times[self.completion_log[-1]] - 1 # Step of the last completion
+                self.finished = True
+                self._flush_open_entries()
+            self.checkpoints = [checkpoint for checkpoint in self.checkpoints if checkpoint['time'] <= self.current_time]
+            self._record_gantt_change(old_gantt_data, resumed_gantt_length, len(old_gantt_data), reopened)
+            return self._drop_replaced_times(pid, old_start_log[resumed_start_log_length:],
+                                             old_completion_log[resumed_completion_log_length:],
+                                             resumed_start_log_length, resumed_completion_log_length)
+
+        later = bisect.bisect_right(times, edit_time)
+        while not self.finished:
+            while later < len(old_checkpoints) and old_checkpoints[later]['time'] < self.current_time:
+                later += 1
+            if (later < len(old_checkpoints) and old_checkpoints[later]['time'] == self.current_time
+                    and self._matches(old_checkpoints[later]) and self._same_progress(pid, old_start_time)):
+                break
+            self.step()
+        else:
+            self._record_gantt_change(old_gantt_data, resumed_gantt_length, len(old_gantt_data), reopened)
+            return self._drop_replaced_times(pid, old_start_log[resumed_start_log_length:],
+                                             old_completion_log[resumed_completion_log_length:],
+                                             resumed_start_log_length, resumed_completion_log_length)
+
+        # Converged: splice in the rest of the previous run. Both runs started and completed
+        # the same processes in between, apart from the edited one.
+        converged = old_checkpoints[later]
+        changed = self._drop_replaced_times(pid, old_start_log[resumed_start_log_length:converged['start_log_length']],
+                                            old_completion_log[resumed_completion_log_length:converged['completion_log_length']],
+                                            resumed_start_log_length, resumed_completion_log_length)
+        gantt_shift = len(self.gantt_data) - converged['gantt_length']
+        start_shift = len(self.start_log) - converged['start_log_length']
+        completion_shift = len(self.completion_log) - converged['completion_log_length']
+        busy_shift = self.busy_time - converged['busy_time']
+        turnaround_shift = self.total_turnaround_time - converged['total_turnaround_time']
+        terminated_shift = self.terminated_count - converged['terminated_count']
+
+        moved_entries = {} # Old gantt_data index -> new index, for bars still open at convergence
+        for core_id, entry in enumerate(self.open_entries):
+            if entry: # Matching guarantees the previous run had the same bar open
+                old_index = converged['open_entries'][core_id][0]
+                entry[3] = old_gantt_data[old_index][3] # Its final end
+                moved_entries[old_index] = self.open_entry_indexes[core_id]
+        self._record_gantt_change(old_gantt_data, resumed_gantt_length, converged['gantt_length'], reopened)
+        self.gantt_data.extend(old_gantt_data[converged['gantt_length']:])
+        self.start_log.extend(old_start_log[converged['start_log_length']:])
+        self.completion_log.extend(old_completion_log[converged['completion_log_length']:])
+
+        self.current_time, self.busy_time, self.total_turnaround_time, self.terminated_count = old_final
+        self.busy_time += busy_shift
+        self.total_turnaround_time += turnaround_shift
+        self.terminated_count += terminated_shift
+        for checkpoint in old_checkpoints[later:]: # No longer shared with the previous run
+            if gantt_shift or moved_entries:
+                checkpoint['open_entries'] = tuple(
+                    (moved_entries.get(saved[0], saved[0] + gantt_shift),) + saved[1:] if saved else None
+                    for saved in checkpoint['open_entries']
+                )
+            checkpoint['gantt_length'] += gantt_shift
+            checkpoint['start_log_length'] += start_shift
+            checkpoint['completion_log_length'] += completion_shift
+            checkpoint['busy_time'] += busy_shift
+            checkpoint['total_turnaround_time'] += turnaround_shift
+            checkpoint['terminated_count'] += terminated_shift
+        self.checkpoints.extend(old_checkpoints[later:])
+        self.open_entries = [None] * self.num_cores
+        self.open_entry_indexes = [None] * self.num_cores
+        self.finished = True
+        return changed
+
+    def _record_gantt_change(self, old_gantt_data, start, old_stop, reopened):
+        """Notes the bars of the re-simulated window: old_gantt_data[start:old_stop] were replaced
+        by the new bars from `start` on, and the bars at the `reopened` indexes by their copies."""
+        self.gantt_changes.append((
+            old_gantt_data[start:old_stop] + [old_gantt_data[index] for index in reopened],
+            self.gantt_data[start:] + [self.gantt_data[index] for index in reopened],
+        ))
+
+    def _same_progress(self, pid, old_start_time):
+        """Tells whether the edited process has started in both runs or in neither. A changed burst
+        can make its remaining time match the previous run's while the other run has not started it."""
+        if pid not in self.remaining_burst_times: # Finished (or removed) in both, given the states match
+            return True
+        started = self.remaining_burst_times[pid] != self.burst_times[pid]
+        return started == (old_start_time is not None and old_start_time < self.current_time)
+
+    def _drop_replaced_times(self, pid, old_starts, old_completions, start_from, completion_from):
+        """Deletes the previous run's start/completion times (`old_starts`, `old_completions`) that
+        the re-simulated window, the logs from `start_from`/`completion_from` on, did not set again.
+        Returns every pid whose times may have changed."""
+        new_starts = set(self.start_log[start_from:])
+        new_completions = set(self.completion_log[completion_from:])
+        for old_pid in old_starts:
+            if old_pid not in new_starts:
+                del self.start_times[old_pid]
+        for old_pid in old_completions:
+            if old_pid not in new_completions:
+                del self.completion_times[old_pid]
+        return {pid} | new_starts | new_completions | set(old_starts) | set(old_completions)
+
+class GanttAggregator:
+    """Folds Gantt bars into at most `max_width` pixel columns per core.
+
+    Columns start at GANTT_TIME_SCALE pixels per time unit, like the canvas chart. When a
+    bar would land past the last column, neighbouring columns are merged pairwise and the
+    time per column doubles. Each column keeps its busy time and the process that covered
+    most of it, so memory and output size are bounded however many bars are streamed in.
+    """
+    def __init__(self, num_cores, max_width=EXPORT_MAX_WIDTH):
+        self.num_cores = num_cores
+        self.max_width = max_width
+        self.shift = 0 # A column spans 2**shift base pixels
+        self.busy = [[0] * max_width for _ in range(num_cores)] # In base pixels
+        self.top_process = [[0] * max_width for _ in range(num_cores)]
+        self.top_amount = [[0] * max_width for _ in range(num_cores)]
+        self.core_busy_time = [0] * num_cores
+        self.end_time = 0
+        self.used_columns = 0
+
+    def add(self, p_id, core_id, start, end):
+        """Adds one Gantt bar [start, end) of process p_id on core_id."""
+        self.core_busy_time[core_id] += end - start
+        start_px = start * GANTT_TIME_SCALE
+        end_px = end * GANTT_TIME_SCALE
+        while (end_px - 1) >> self.shift >= self.max_width:
+            self._coarsen()
+        busy = self.busy[core_id]
+        top_process = self.top_process[core_id]
+        top_amount = self.top_amount[core_id]
+        last_column = (end_px - 1) >> self.shift
+        for column in range(start_px >> self.shift, last_column + 1):
+            amount = min(end_px, (column + 1) << self.shift) - max(start_px, column << self.shift)
+            busy[column] += amount
+            if amount > top_amount[column]:
+                top_amount[column] = amount
+                top_process[column] = p_id
+        self.used_columns = max(self.used_columns, last_column + 1)
+
+    def _coarsen(self):
+        for core_id in range(self.num_cores):
+            busy = self.busy[core_id]
+            top_process = self.top_process[core_id]
+            top_amount = self.top_amount[core_id]
+            for column in range(0, self.max_width, 2):
+                keep = column if top_amount[column] >= top_amount[column + 1] else column + 1
+                busy[column // 2] = busy[column] + busy[column + 1]
+                top_process[column // 2] = top_process[keep]
+                top_amount[column // 2] = top_amount[keep]
+            for column in range(self.max_width // 2, self.max_width):
+                busy[column] = top_process[column] = top_amount[column] = 0
+        self.shift += 1
+        self.used_columns = (self.used_columns + 1) // 2
+
+    def time_to_x(self, time_value):
+        return (time_value * GANTT_TIME_SCALE) / (1 << self.shift)
+
+    def width(self):
+        return max(self.used_columns, int(self.time_to_x(self.end_time)) + 1)
+
+    def runs(self, core_id):
+        """Yields (first_column, last_column + 1, p_id, busy fraction) for the non-idle columns of a core."""
+        column_size = 1 << self.shift
+        busy = self.busy[core_id]
+        top_process = self.top_process[core_id]
+        run = None
+        for column in range(self.used_columns):
+            if not busy[column]:
+                if run:
+                    yield tuple(run)
+                    run = None
+                continue
+            fraction = busy[column] / column_size
+            if run and run[2] == top_process[column] and run[3] == fraction == 1:
+                run[1] = column + 1
+                continue
+            if run:
+                yield tuple(run)
+            run = [column, column + 1, top_process[column], fraction]
+        if run:
+            yield tuple(run)
+
+    def utilization_columns(self):
+        """Yields the fraction of all cores busy in each column."""
+        column_capacity = (1 << self.shift) * self.num_cores
+        for column in range(self.used_columns):
+            yield sum(self.busy[core_id][column] for core_id in range(self.num_cores)) / column_capacity
+
+    def tick_step(self):
+        """Returns a 1-2-5 time step that keeps axis labels at least EXPORT_MIN_TICK_GAP pixels apart."""
+        step = 1
+        while True:
+            for factor in (1, 2, 5):
+                if self.time_to_x(step * factor) >= EXPORT_MIN_TICK_GAP:
+                    return step * factor
+            step *= 10
+
+def _export_layout(aggregator):
+    """Returns the geometry shared by the SVG and PNG writers."""
+    row_height = GANTT_BAR_HEIGHT + GANTT_PADDING
+    axis_y = EXPORT_MARGIN_TOP + (aggregator.num_cores + 0.5) * row_height
+    utilization_top = axis_y + 30
+    return {
+        'left': GANTT_X_START,
+        'row_height': row_height,
+        'axis_y': axis_y,
+        'utilization_top': utilization_top,
+        'width': GANTT_X_START + aggregator.width() + EXPORT_MARGIN_RIGHT,
+        'height': int(utilization_top + EXPORT_UTILIZATION_HEIGHT + 20),
+    }
+
+def _process_color(p_id):
+    return COLOR_HEX[PROCESS_COLORS[(p_id - 1) % len(PROCESS_COLORS)]]
+
+def write_gantt_svg(path, aggregator, title=""):
+    """Writes the aggregated Gantt chart, per-core utilization and utilization timeline as SVG."""
+    layout = _export_layout(aggregator)
+    left = layout['left']
+    axis_y = layout['axis_y']
+    with open(path, "w") as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{layout["width"]}" height="{layout["height"]}" '
+                f'font-family="Arial" font-size="10">\n')
+        f.write('<rect width="100%" height="100%" fill="white"/>\n')
+        f.write(f'<text x="10" y="20" font-size="12" font-weight="bold">{escape(title)}</text>\n')
+
+        for core_id in range(aggregator.num_cores):
+            y = EXPORT_MARGIN_TOP + core_id * layout['row_height']
+            f.write(f'<text x="{left - 10}" y="{y + GANTT_BAR_HEIGHT / 2}" text-anchor="end" dominant-baseline="middle">C{core_id}</text>\n')
+            for first, last, p_id, fraction in aggregator.runs(core_id):
+                width = last - first
+                opacity = "" if fraction >= 1 else f' fill-opacity="{fraction:.2f}"'
+                stroke = ' stroke="black" stroke-width="0.5"' if width > 2 else ""
+                f.write(f'<rect x="{left + first}" y="{y}" width="{width}" height="{GANTT_BAR_HEIGHT}" fill="{_process_color(p_id)}"{opacity}{stroke}/>\n')
+                if width > 15 and fraction >= 1: # Label only solid bars wide enough for the text
+                    f.write(f'<text x="{left + first + width / 2}" y="{y + GANTT_BAR_HEIGHT / 2}" fill="white" font-size="8" '
+                            f'text-anchor="middle" dominant-baseline="middle">P{p_id}</text>\n')
+            if aggregator.end_time > 0:
+                utilization = aggregator.core_busy_time[core_id] / aggregator.end_time * 100
+                f.write(f'<text x="{left + aggregator.width() + 10}" y="{y + GANTT_BAR_HEIGHT / 2}" dominant-baseline="middle">{utilization:.1f}%</text>\n')
+
+        axis_end = left + aggregator.time_to_x(aggregator.end_time)
+        f.write(f'<line x1="{left}" y1="{axis_y}" x2="{axis_end}" y2="{axis_y}" stroke="black"/>\n')
+        tick_step = aggregator.tick_step()
+        for t in range(0, aggregator.end_time + 1, tick_step):
+            x = left + aggregator.time_to_x(t)
+            f.write(f'<line x1="{x}" y1="{axis_y - 3}" x2="{x}" y2="{axis_y + 3}" stroke="black"/>\n')
+            f.write(f'<text x="{x}" y="{axis_y + 15}" text-anchor="middle">{t}</text>\n')
+
+        bottom = layout['utilization_top'] + EXPORT_UTILIZATION_HEIGHT
+        f.write(f'<text x="{left - 10}" y="{bottom}" text-anchor="end">Util</text>\n')
+        f.write(f'<line x1="{left}" y1="{bottom}" x2="{axis_end}" y2="{bottom}" stroke="gray"/>\n')
+        run_start, run_fraction = 0, None
+        for column, fraction in enumerate(list(aggregator.utilization_columns()) + [None]):
+            if fraction == run_fraction:
+                continue
+            if run_fraction:
+                height = run_fraction * EXPORT_UTILIZATION_HEIGHT
+                f.write(f'<rect x="{left + run_start}" y="{bottom - height:.1f}" width="{column - run_start}" height="{height:.1f}" fill="steelblue"/>\n')
+            run_start, run_fraction = column, fraction
+        f.write('</svg>\n')
+
+def write_gantt_png(path, aggregator):
+    """Writes the same chart as write_gantt_svg as an RGB PNG, without text labels."""
+    layout = _export_layout(aggregator)
+    width, height = layout['width'], layout['height']
+    left = layout['left']
+    rows = [bytearray(b"\xff" * (width * 3)) for _ in range(height)]
+
+    def fill(x0, x1, y0, y1, rgb, alpha=1.0):
+        x0, x1 = max(0, int(x0)), min(width, int(x1))
+        if x1 <= x0:
+            return
+        pixel = bytes(round(255 - alpha * (255 - c)) for c in rgb) # Blend over white
+        for y in range(max(0, int(y0)), min(height, int(y1))):
+            rows[y][x0 * 3:x1 * 3] = pixel * (x1 - x0)
+
+    for core_id in range(aggregator.num_cores):
+        y = EXPORT_MARGIN_TOP + core_id * layout['row_height']
+        for first, last, p_id, fraction in aggregator.runs(core_id):
+            rgb = bytes.fromhex(_process_color(p_id)[1:])
+            fill(left + first, left + last, y, y + GANTT_BAR_HEIGHT, rgb, min(fraction, 1.0))
+            if last - first > 2:
+                fill(left + first, left + last, y, y + 1, b"\x00\x00\x00")
+                fill(left + first, left + last, y + GANTT_BAR_HEIGHT - 1, y + GANTT_BAR_HEIGHT, b"\x00\x00\x00")
+                fill(left + first, left + first + 1, y, y + GANTT_BAR_HEIGHT, b"\x00\x00\x00")
+                fill(left + last - 1, left + last, y, y + GANTT_BAR_HEIGHT, b"\x00\x00\x00")
+
+    axis_y = int(layout['axis_y'])
+    axis_end = left + aggregator.time_to_x(aggregator.end_time)
+    fill(left, axis_end + 1, axis_y, axis_y + 1, b"\x00\x00\x00")
+    for t in range(0, aggregator.end_time + 1, aggregator.tick_step()):
+        x = left + aggregator.time_to_x(t)
+        fill(x, x + 1, axis_y - 3, axis_y + 4, b"\x00\x00\x00")
+
+    bottom = int(layout['utilization_top'] + EXPORT_UTILIZATION_HEIGHT)
+    steelblue = bytes.fromhex(COLOR_HEX["steelblue"][1:])
+    for column, fraction in enumerate(aggregator.utilization_columns()):
+        fill(left + column, left + column + 1, bottom - fraction * EXPORT_UTILIZATION_HEIGHT, bottom, steelblue)
+    fill(left, axis_end + 1, bottom, bottom + 1, bytes.fromhex(COLOR_HEX["gray"][1:]))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        compressor = zlib.compressobj()
+        data = bytearray()
+        for row in rows:
+            data += compressor.compress(b"\x00" + bytes(row)) # Filter type 0
+        data += compressor.flush()
+        f.write(chunk(b"IDAT", bytes(data)))
+        f.write(chunk(b"IEND", b""))
+
+def export_gantt(workload, time_quantum, num_cores, path, max_width=EXPORT_MAX_WIDTH):
+    """Simulates `workload` headlessly and streams its Gantt chart to an .svg or .png file.
+
+    Returns the finished RRSimulationEngine so callers can report its metrics.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in (".svg", ".png"):
+        raise ValueError(f"Unsupported export format '{extension}', expected .svg or .png.")
+    aggregator = GanttAggregator(num_cores, max_width - max_width % 2)
+    engine = RRSimulationEngine(workload, time_quantum, num_cores, on_slice=aggregator.add, keep_gantt=False).run()
+    aggregator.end_time = engine.current_time
+
+    if extension == ".svg":
+        avg_waiting_time, avg_turnaround_time, cpu_utilization = engine.metrics()
+        title = (f"Round Robin, quantum {time_quantum}, {num_cores} cores, {len(workload)} processes, "
+                 f"finished at {engine.current_time} | avg waiting {avg_waiting_time:.2f}, "
+                 f"avg turnaround {avg_turnaround_time:.2f}, CPU {cpu_utilization:.2f}%")
+        write_gantt_svg(path, aggregator, title)
+    else:
+        write_gantt_png(path, aggregator)
+    return engine
+
+def generate_workload(rng, num_processes, max_arrival, min_burst, max_burst):
+    """Returns a random list of (arrival_time, burst_time) pairs drawn from `rng`."""
+    return [(rng.randint(0, max_arrival), rng.randint(min_burst, max_burst)) for _ in range(num_processes)]
+
+def replication_seed(base_seed, index):
+    """Derives the seed of one replication; string seeds give independent, reproducible streams."""
+    return f"{base_seed}:{index}"
+
+def run_replication(config, seed):
+    """Simulates one random workload for `config` and returns its metrics. Runs in worker processes."""
+    rng = random.Random(seed)
+    workload = generate_workload(rng, config['num_processes'], config['max_arrival'], config['min_burst'], config['max_burst'])
+    engine = RRSimulationEngine(workload, config['time_quantum'], config['num_cores'], keep_gantt=False).run()
+    return engine.metrics()
+
+def t_quantile_95(df):
+    """Returns the two-sided 95% Student t quantile for `df` degrees of freedom. Beyond the
+    table it uses the Cornish-Fisher expansion around the normal quantile (error < 1e-5)."""
+    if df <= len(T_95):
+        return T_95[df - 1]
+    z = Z_975
+    return (z + (z ** 3 + z) / (4 * df)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3))
+
+def confidence_interval(values):
+    """Returns (mean, half width) of the 95% Student t confidence interval of `values`."""
+    n = len(values)
+    mean = statistics.fmean(values)
+    if n < 2:
+        return mean, float("inf")
+    return mean, t_quantile_95(n - 1) * statistics.stdev(values) / math.sqrt(n)
+
+def run_replications(config, ci_width=MC_CI_WIDTH, base_seed=0, batch_size=MC_BATCH_SIZE,
+                     max_replications=MC_MAX_REPLICATIONS, workers=None, on_batch=None):
+    """Runs seeded replications in parallel batches until every metric's 95% CI is narrow enough.
+
+    A metric has converged when the full interval width is at most `ci_width` times its
+    mean. Batches grow with the run (at least `batch_size`, then a quarter of the results
+    so far) and replication i always uses the same seed, so a run is reproducible whatever
+    the number of workers. Returns (replications, intervals, converged), with one
+    (mean, half width) pair per entry of METRIC_NAMES; `converged` is False when
+    `max_replications` ran out before every interval was narrow enough.
+    """
+    results = []
+    workers = workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        while len(results) < max_replications:
+            count = min(max(batch_size, len(results) // 4), max_replications - len(results))
+            seeds = [replication_seed(base_seed, len(results) + i) for i in range(count)]
+            chunksize = max(1, count // (workers * 4))
+            results.extend(executor.map(run_replication, [config] * count, seeds, chunksize=chunksize))
+            intervals = [confidence_interval([r[m] for r in results]) for m in range(len(METRIC_NAMES))]
+            if on_batch:
+                on_batch(len(results), intervals)
+            if len(results) >= MC_MIN_REPLICATIONS and all(2 * half <= ci_width * abs(mean) for mean, half in intervals):
+                return len(results), intervals, True
+    return len(results), intervals, False
+
+def check_edits(trials, seed=0, edits_per_trial=6):
+    """Applies random edits to finished runs with checkpoints and compares each result with a
+    full rerun of the edited workload: times, metrics, Gantt data, and the Gantt data rebuilt
+    from gantt_changes the way the GUI patches its chart. Checkpoint intervals are kept small
+    so edits resume from and converge at checkpoints often. Returns the number of edits checked;
+    raises AssertionError naming the first edit that differs.
+    """
+    rng = random.Random(seed)
+    checked = 0
+    for trial in range(trials):
+        time_quantum, num_cores = rng.randint(1, 4), rng.randint(1, 4)
+        workload = generate_workload(rng, rng.randint(0, 40), 60, 1, 8)
+        processes = dict(enumerate(workload, start=1)) # pid -> (arrival_time, burst_time)
+        next_pid = len(processes) + 1
+        engine = RRSimulationEngine(workload, time_quantum, num_cores, pids=list(processes),
+                                    checkpoint_interval=rng.choice([1, 3, 8, CHECKPOINT_INTERVAL])).run()
+        bars = {(entry[1], entry[2]): tuple(entry) for entry in engine.gantt_data}
+        for edit in range(edits_per_trial):
+            choice = rng.random()
+            if choice < 0.4 or not processes: # Add
+                pid, next_pid = next_pid, next_pid + 1
+                processes[pid] = (rng.randint(0, 70), rng.randint(1, 8))
+            elif choice < 0.7: # Remove
+                pid = rng.choice(list(processes))
+                del processes[pid]
+            else: # Change
+                pid = rng.choice(list(processes))
+                processes[pid] = (rng.randint(0, 70), rng.randint(1, 8))
+            engine.apply_edit(pid, *processes.get(pid, ()))
+            rerun = RRSimulationEngine(list(processes.values()), time_quantum, num_cores, pids=list(processes)).run()
+            for removed, added in engine.gantt_changes:
+                for entry in removed:
+                    bars.pop((entry[1], entry[2]), None)
+                for entry in added:
+                    bars[(entry[1], entry[2])] = tuple(entry)
+            mismatches = [name for name, edited, full in (
+                ("end time", engine.current_time, rerun.current_time),
+                ("start times", engine.start_times, rerun.start_times),
+                ("completion times", engine.completion_times, rerun.completion_times),
+                ("metrics", engine.metrics(), rerun.metrics()),
+                ("Gantt data", engine.gantt_data, rerun.gantt_data),
+                ("patched Gantt bars", bars, {(entry[1], entry[2]): tuple(entry) for entry in rerun.gantt_data}),
+            ) if edited != full]
+            if mismatches:
+                raise AssertionError(f"trial {trial}, edit {edit} (pid {pid}): {', '.join(mismatches)} differ from a full rerun")
+            checked += 1
+    return checked
+
+class VirtualProcessList:
+    """Process list that only keeps the visible rows in its Listbox.
+
+    Rows come from `source()` (the app's process list) through an index view. Rows appended
+    to source() are filtered and sorted into the view on their own, and it is only rebuilt by
+    invalidate(), so scrolling, refreshing and live admissions cost the same for ten
+    processes or a million. Its widgets live in `frame`, for the caller to place.
+    """
+    def __init__(self, master, source, on_select=None, height=8, width=30):
+        self.frame = ttk.Frame(master)
+        self.source = source
+        self.on_select = on_select
+        self.height = height
+        self.offset = 0
+        self.view = None # None means identity order over source()
+        self.view_keys = [] # Sort key of each view row
+        self.view_filter = ""
+        self.view_sort_key = None
+        self.view_built_for = None # Number of source() rows in the view
+        self.selected_id = None
+
+        self.filter_entry = ttk.Entry(self.frame, width=12)
+        self.filter_entry.grid(row=0, column=0, sticky="ew", pady=(0, 2))
+        self.filter_entry.bind("<Return>", lambda e: self.invalidate())
+        self.sort_combobox = ttk.Combobox(self.frame, values=list(PROCESS_LIST_SORT_KEYS), state="readonly", width=8)
+        self.sort_combobox.set("Order")
+        self.sort_combobox.grid(row=0, column=1, columnspan=2, sticky="e", pady=(0, 2))
+        self.sort_combobox.bind("<<ComboboxSelected>>", lambda e: self.invalidate())
+
+        self.listbox = tk.Listbox(self.frame, height=height, width=width, exportselection=False)
+        self.listbox.grid(row=1, column=0, columnspan=2, sticky="ew")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scroll)
+        self.scrollbar.grid(row=1, column=2, sticky="ns")
+        self.frame.grid_columnconfigure(0, weight=1)
+
+        self.listbox.bind("<<ListboxSelect>>", self._on_listbox_select)
+        self.listbox.bind("<MouseWheel>", lambda e: self._scroll_by(-1 if e.delta > 0 else 1))
+        self.listbox.bind("<Button-4>", lambda e: self._scroll_by(-1))
+        self.listbox.bind("<Button-5>", lambda e: self._scroll_by(1))
+
+    def invalidate(self):
+        """Rebuilds the index view with the current filter and sort key, e.g. after they changed
+        or the process list was reordered or shrank."""
+        self.view_built_for = None
+        self.refresh()
+
+    def _ensure_view(self):
+        processes = self.source()
+        if self.view_built_for == len(processes):
+            return
+        if self.view_built_for is None or self.view_built_for > len(processes):
+            self.view_filter = self.filter_entry.get().strip().lower()
+            self.view_sort_key = PROCESS_LIST_SORT_KEYS[self.sort_combobox.get()]
+            self.view = None if not self.view_filter and self.view_sort_key is None else []
+            self.view_keys = []
+            self.view_built_for = 0
+        if self.view is not None:
+            self._add_rows(processes, self.view_built_for)
+        self.view_built_for = len(processes)
+
+    def _add_rows(self, processes, first):
+        """Filters and sorts the source rows from `first` on into the view."""
+        rows = range(first, len(processes))
+        if self.view_filter:
+            rows = [i for i in rows if self.view_filter in repr(processes[i]).lower()]
+        sort_key = self.view_sort_key
+        if sort_key is None:
+            self.view.extend(rows)
+        elif len(rows) <= 64: # E.g. one live batch: insert each, after rows with equal keys
+            for i in rows:
+                key = sort_key(processes[i])
+                position = bisect.bisect_right(self.view_keys, key)
+                self.view_keys.insert(position, key)
+                self.view.insert(position, i)
+        else: # Ties keep source order, like a stable sort
+            keyed = heapq.merge(zip(self.view_keys, self.view), sorted((sort_key(processes[i]), i) for i in rows))
+            self.view_keys, self.view = [], []
+            for key, i in keyed:
+                self.view_keys.append(key)
+                self.view.append(i)
+
+    def row_count(self):
+        self._ensure_view()
+        return len(self.source()) if self.view is None else len(self.view)
+
+    def process_at(self, row):
+        processes = self.source()
+        return processes[row] if self.view is None else processes[self.view[row]]
+
+    def refresh(self):
+        """Re-renders the visible window of rows."""
+        count = self.row_count()
+        self.offset = max(0, min(self.offset, count - self.height))
+        self.listbox.delete(0, tk.END)
+        for row in range(self.offset, min(self.offset + self.height, count)):
+            process = self.process_at(row)
+            self.listbox.insert(tk.END, repr(process))
+            if process.id == self.selected_id:
+                self.listbox.selection_set(tk.END)
+        if count > self.height:
+            self.scrollbar.set(self.offset / count, (self.offset + self.height) / count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _scroll_by(self, rows):
+        self.offset += rows
+        self.refresh()
+
+    def _on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.offset = int(float(amount) * self.row_count())
+            self.refresh()
+        elif unit == "pages":
+            self._scroll_by(int(amount) * self.height)
+        else:
+            self._scroll_by(int(amount))
+
+    def _on_listbox_select(self, event=None):
+        selection = self.listbox.curselection()
+        if not selection:
+            return
+        process = self.process_at(self.offset + selection[0])
+        self.selected_id = process.id
+        if self.on_select:
+            self.on_select(process)
+
+class LiveIngestServer:
+    """Accepts job submissions over a local socket on a background asyncio loop.
+
+    Each client sends one JSON object per line, e.g. {"arrival_time": 12, "burst_time": 4}.
+    Parsed submissions land in a bounded queue that the Tk thread drains in batches;
+    while the queue is full the server stops reading, so clients are slowed down by
+    the socket buffers instead of the queue growing without bound.
+    """
+    def __init__(self, address, max_pending=LIVE_INGEST_QUEUE_SIZE):
+        self.kind, self.target = parse_listen_address(address)
+        self.pending = queue.Queue(maxsize=max_pending)
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.clients = set()
+        self.space_available = None # asyncio.Event set by drain(), created on the loop
+        self._ready = threading.Event()
+        self._error = None
+
+    def start(self):
+        """Starts the event loop thread and waits until the socket is listening."""
+        self.thread = threading.Thread(target=self._run, name="live-ingest", daemon=True)
+        self.thread.start()
+        self._ready.wait()
+        if self._error:
+            raise self._error
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._start_server())
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            self.loop.close()
+            return
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    async def _start_server(self):
+        self.space_available = asyncio.Event()
+        if self.kind == "unix":
+            self.server = await asyncio.start_unix_server(self._handle_client, path=self.target)
+        else:
+            host, port = self.target
+            self.server = await asyncio.start_server(self._handle_client, host, port)
+
+    async def _handle_client(self, reader, writer):
+        self.clients.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    submission = parse_submission(line)
+                except ValueError as e: # json.JSONDecodeError is a ValueError too
+                    writer.write((json.dumps({"error": str(e)}) + "\n").encode())
+                    await writer.drain()
+                    continue
+                while True:
+                    try:
+                        self.pending.put_nowait(submission)
+                        break
+                    except queue.Full:
+                        if writer.is_closing():
+                            return
+                        self.space_available.clear() # A drain() from now on sets it again
+                        await self.space_available.wait() # Backpressure
+        except (ConnectionError, ValueError): # ValueError: line longer than the stream limit
+            pass
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+    async def _shutdown(self):
+        if self.server:
+            self.server.close()
+        for writer in list(self.clients):
+            writer.transport.abort() # Readers see EOF and finish
+        self.space_available.set() # Wakes clients blocked on a full queue so they see the abort
+        await asyncio.sleep(0)
+
+    def drain(self, limit=LIVE_INGEST_BATCH_SIZE):
+        """Returns up to `limit` pending submissions without blocking."""
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self.pending.get_nowait())
+            except queue.Empty:
+                break
+        if batch and self.loop and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.space_available.set)
+        return batch
+
+    def stop(self):
+        """Closes the listening socket and stops the event loop thread."""
+        if not self.loop or self.loop.is_closed():
+            return
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+        future.result(timeout=2)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=2)
+        if self.kind == "unix" and os.path.exists(self.target):
+            os.unlink(self.target)
+
 class RRSchedulerApp:
-    def __init__(self, master):
+    def __init__(self, master, live_server=None, live_time_mode="wallclock", seed=None):
         self.master = master
         self.master.title("Multicore Round Robin Scheduling Simulator")
         self.master.geometry("1000x800") 
@@ -92,6 +1162,10 @@ class RRSchedulerApp:
         self.terminated_processes = []
         self.cores = [] 
         self.gantt_data = []
+        self.pending_arrivals = [] # Heap of (arrival_time, id, process) not yet arrived
+        self.total_turnaround_time = 0 # Running totals over terminated_processes
+        self.terminated_burst_time = 0
+        self.busy_time = 0 # Time units executed on all cores
 
         self.current_time = 0
         self.time_quantum = 1
@@ -100,9 +1174,21 @@ class RRSchedulerApp:
         self.simulation_paused = False
         self.animation_speed_factor = 1.0 # 1.0
         self.process_counter = 0
-        self.colors = ["red", "blue", "green", "orange", "purple", "brown", "pink", "cyan", "magenta", "yellow", "lime", "teal"]
-        random.shuffle(self.colors)
+        self.colors = list(PROCESS_COLORS)
+        self.rng = random.Random(seed) # Seeded for reproducible color order
+        self.rng.shuffle(self.colors)
         self.color_index = 0
+        self.live_server = live_server # LiveIngestServer
+        self.live_time_mode = live_time_mode
+        self.live_clock_start = None # time.monotonic() at simulated time 0, shifted by pauses
+        self.paused_at = None
+        self.selected_process = None
+        self.run_finished = False # Edits after a finished run are re-simulated right away
+        self.engine = None # RRSimulationEngine stepped along with a non-live run, checkpointed for edits
+        self.process_by_id = {} # The engine's workload
+        self.gantt_bar_ids = {} # Filled by _reset_gantt_chart and _draw_gantt_bar
+        self.gantt_tick_ids = {}
+        self.gantt_axis_time = -1
 
         self._setup_gui()
 
@@ -130,12 +1216,20 @@ class RRSchedulerApp:
         self.burst_time_entry.grid(row=1, column=1, sticky="w", pady=2)
         self.burst_time_entry.insert(0, "5")
 
-        self.add_process_button = ttk.Button(control_frame, text="Tambah Process", command=self.add_process)
-        self.add_process_button.grid(row=2, column=0, columnspan=2, pady=5)
-
-        ttk.Label(control_frame, text="List Proses:").grid(row=3, column=0, columnspan=2, sticky="w", pady=(10, 0))
-        self.process_listbox = tk.Listbox(control_frame, height=8, width=30)
-        self.process_listbox.grid(row=4, column=0, columnspan=2, pady=2, sticky="ew")
+        edit_frame = ttk.Frame(control_frame)
+        edit_frame.grid(row=2, column=0, columnspan=2, pady=5)
+        self.add_process_button = ttk.Button(edit_frame, text="Tambah Process", command=self.add_process)
+        self.add_process_button.grid(row=0, column=0, columnspan=2)
+        self.update_process_button = ttk.Button(edit_frame, text="Update", width=7, command=self.update_process)
+        self.update_process_button.grid(row=1, column=0, pady=(2, 0))
+        self.remove_process_button = ttk.Button(edit_frame, text="Hapus", width=7, command=self.remove_process)
+        self.remove_process_button.grid(row=1, column=1, pady=(2, 0))
+
+        ttk.Label(control_frame, text="List Proses:").grid(row=3, column=0, sticky="w", pady=(10, 0))
+        self.load_trace_button = ttk.Button(control_frame, text="Load Trace", command=self.load_trace)
+        self.load_trace_button.grid(row=3, column=1, sticky="e", pady=(10, 0))
+        self.process_list = VirtualProcessList(control_frame, lambda: self.processes, on_select=self.focus_process)
+        self.process_list.frame.grid(row=4, column=0, columnspan=2, pady=2, sticky="ew")
 
         ttk.Label(control_frame, text="Quantum Time:").grid(row=5, column=0, sticky="w", pady=2)
         self.time_quantum_spinbox = tk.Spinbox(control_frame, from_=1, to=10, width=5, wrap=True)
@@ -176,7 +1270,8 @@ class RRSchedulerApp:
         hbar.pack(side=tk.BOTTOM, fill=tk.X)
         vbar = ttk.Scrollbar(vis_frame, orient=tk.VERTICAL, command=self.canvas.yview)
         vbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.config(xscrollcommand=hbar.set, yscrollcommand=vbar.set)
+        self.canvas_hbar = hbar
+        self.canvas.config(xscrollcommand=self._on_canvas_xscroll, yscrollcommand=vbar.set)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
 
@@ -267,24 +1362,167 @@ class RRSchedulerApp:
              messagebox.showwarning("Warning", "Cannot add processes during simulation.")
              return
         try:
-            arrival_time = int(self.arrival_time_entry.get())
-            burst_time = int(self.burst_time_entry.get())
-            if arrival_time < 0 or burst_time <= 0:
-                raise ValueError("Arrival time must be >= 0 and Burst time must be > 0.")
+            arrival_time, burst_time = self._read_process_entries()
 
             self.process_counter += 1
             new_process = Process(self.process_counter, arrival_time, burst_time, self.canvas, self._get_next_color())
             self.processes.append(new_process)
-            self.process_listbox.insert(tk.END, repr(new_process))
+            if self.run_finished:
+                self.terminated_processes.append(new_process)
+                self.process_by_id[new_process.id] = new_process
+                self._resimulate_edit(new_process)
+            self.process_list.refresh()
 
             self.arrival_time_entry.delete(0, tk.END)
             self.arrival_time_entry.insert(0, str(arrival_time + 1))
             self.burst_time_entry.delete(0, tk.END)
-            self.burst_time_entry.insert(0, str(random.randint(3, 8))) # Suggest
+            self.burst_time_entry.insert(0, str(self.rng.randint(3, 8))) # Suggest
+
 
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid input: {e}")
 
+    def _read_process_entries(self):
+        arrival_time = int(self.arrival_time_entry.get())
+        burst_time = int(self.burst_time_entry.get())
+        if arrival_time < 0 or burst_time <= 0:
+            raise ValueError("Arrival time must be >= 0 and Burst time must be > 0.")
+        return arrival_time, burst_time
+
+    def update_process(self):
+        """Sets the selected process's arrival and burst time from the input fields."""
+        process = self.selected_process
+        if self.simulation_running or process is None:
+             messagebox.showwarning("Warning", "Select a process while no simulation is running.")
+             return
+        try:
+            arrival_time, burst_time = self._read_process_entries()
         except ValueError as e:
             messagebox.showerror("Input Error", f"Invalid input: {e}")
+            return
+        process.arrival_time = arrival_time
+        process.burst_time = burst_time
+        if self.run_finished:
+            self._resimulate_edit(process)
+        self.process_list.invalidate()
+
+    def remove_process(self):
+        """Removes the selected process."""
+        process = self.selected_process
+        if self.simulation_running or process is None:
+             messagebox.showwarning("Warning", "Select a process while no simulation is running.")
+             return
+        if self.run_finished:
+            self.terminated_processes.remove(process)
+            del self.process_by_id[process.id]
+        self.processes.remove(process)
+        process.destroy_visual()
+        self.selected_process = None
+        self.process_list.selected_id = None
+        if self.run_finished:
+            self._resimulate_edit(process, removed=True)
+        self.process_list.invalidate()
+
+    def _resimulate_edit(self, process, removed=False):
+        """Re-simulates a finished run after `process` was added, changed or removed, reusing the
+        unchanged part of the previous schedule, and refreshes the results and the changed bars."""
+        engine = self.engine
+        if removed:
+            changed = engine.apply_edit(process.id)
+        else:
+            changed = engine.apply_edit(process.id, process.arrival_time, process.burst_time)
+        for p_id in changed:
+            p = self.process_by_id.get(p_id)
+            if p is None: # The removed process
+                continue
+            p.start_time = engine.start_times[p_id]
+            p.completion_time = engine.completion_times[p_id]
+            p.turnaround_time = p.completion_time - p.arrival_time
+            p.waiting_time = p.turnaround_time - p.burst_time
+            p.remaining_burst_time = 0
+            p.state = "Terminated"
+
+        self.gantt_data = engine.gantt_data
+        self.current_time = engine.current_time
+        self.total_turnaround_time = engine.total_turnaround_time
+        self.terminated_burst_time = engine.busy_time # Every process has run its whole burst
+        self.busy_time = engine.busy_time
+        self.time_label.config(text=f"Time: {self.current_time}")
+        self.results_label.config(text=self._format_metrics())
+
+        for removed_bars, added_bars in engine.gantt_changes:
+            for entry in removed_bars:
+                for item in self.gantt_bar_ids[entry[0]].pop((entry[1], entry[2])): # By id; deleting by tag scans every item
+                    if item:
+                        self.canvas.delete(item)
+            for entry in added_bars:
+                p = self.process_by_id.get(entry[0])
+                self._draw_gantt_bar(entry, p.color if p else "gray") # Fallback
+        if not self.gantt_data: # No processes left
+            self._reset_gantt_chart()
+            return
+        self._trim_gantt_axis(self.current_time)
+        self._extend_gantt_axis(self.current_time)
+
+    def load_trace(self):
+        """Bulk loads processes from a trace file chosen by the user."""
+        if self.simulation_running:
+             messagebox.showwarning("Warning", "Cannot add processes during simulation.")
+             return
+        path = filedialog.askopenfilename(
+            title="Load Trace",
+            filetypes=[("Trace files", "*.csv *.jsonl *.ndjson *.txt"), ("All files", "*")]
+        )
+        if not path:
+            return
+        try:
+            pairs = list(read_trace(path))
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Input Error", f"Could not load trace: {e}")
+            return
+        self.add_processes_bulk(pairs)
+
+    def add_processes_bulk(self, pairs):
+        """Adds processes for (arrival_time, burst_time) pairs without per-row GUI work."""
+        new_processes = []
+        for arrival_time, burst_time in pairs:
+            self.process_counter += 1
+            new_processes.append(Process(self.process_counter, arrival_time, burst_time, self.canvas, self._get_next_color()))
+        self.processes.extend(new_processes)
+        self.process_list.refresh()
+
+    def focus_process(self, process):
+        """Highlights a process on the canvas and in the Gantt chart and scrolls to it."""
+        previous = self.selected_process
+        if previous:
+            if previous.visual_id:
+                self.canvas.itemconfig(previous.visual_id, outline="black", width=1)
+            for rect_id, _ in self.gantt_bar_ids.get(previous.id, {}).values():
+                self.canvas.itemconfig(rect_id, outline="black", width=1)
+        self.selected_process = process
+        if not self.simulation_running: # Ready to be edited
+            self.arrival_time_entry.delete(0, tk.END)
+            self.arrival_time_entry.insert(0, str(process.arrival_time))
+            self.burst_time_entry.delete(0, tk.END)
+            self.burst_time_entry.insert(0, str(process.burst_time))
+
+        target_bbox = None
+        bars = self.gantt_bar_ids.get(process.id) # Item ids, as tag searches scan the whole canvas
+        if bars:
+            for rect_id, text_id in bars.values():
+                self.canvas.itemconfig(rect_id, outline="gold", width=3)
+                self.canvas.tag_raise(rect_id)
+                if text_id:
+                    self.canvas.tag_raise(text_id)
+            target_bbox = (GANTT_X_START + min(start for _, start in bars) * GANTT_TIME_SCALE,
+                           self.gantt_y_start + min(core_id for core_id, _ in bars) * (GANTT_BAR_HEIGHT + GANTT_PADDING))
+        if process.visual_id:
+            self.canvas.itemconfig(process.visual_id, outline="gold", width=3)
+            target_bbox = self.canvas.bbox(process.visual_id)
+        if target_bbox:
+            scroll_region = list(map(int, self.canvas.cget("scrollregion").split()))
+            self.canvas.xview_moveto(max(0, (target_bbox[0] - 50) / scroll_region[2]))
+            self.canvas.yview_moveto(max(0, (target_bbox[1] - 50) / scroll_region[3]))
 
     def update_speed(self, val):
         """Updates the animation speed factor from the scale."""
@@ -300,8 +1538,11 @@ class RRSchedulerApp:
             return
         self.simulation_paused = not self.simulation_paused
         if self.simulation_paused:
+            self.paused_at = time.monotonic()
             self.pause_button.config(text="Resume")
         else:
+            if self.live_clock_start is not None: # The pause does not count as simulated time
+                self.live_clock_start += time.monotonic() - self.paused_at
             self.pause_button.config(text="Pause")
             self.simulasi_langkah()
 
@@ -316,21 +1557,35 @@ class RRSchedulerApp:
         self.ready_queue.clear()
         self.terminated_processes = []
         self.gantt_data = []
+        self.pending_arrivals = []
+        self._reset_totals()
         self.cores = [] # Will
 
         self.current_time = 0
         self.simulation_running = False
         self.simulation_paused = False
+        self.run_finished = False
+        self.engine = None
+        self.process_by_id = {}
         self.process_counter = 0
         self.color_index = 0
 
         self.time_label.config(text="Time: 0")
-        self.process_listbox.delete(0, tk.END)
+        self.selected_process = None
+        self.process_list.selected_id = None
+        self.process_list.offset = 0
+        self.process_list.invalidate()
         self.canvas.delete("process") # Clear
         self.canvas.delete("gantt")   # Clear
+        self.gantt_bar_ids = {}
+        self.gantt_tick_ids = {}
+        self.gantt_axis_time = -1
         self.results_label.config(text="Waiting for simulation end...")
         self.start_button.config(state=tk.NORMAL)
         self.add_process_button.config(state=tk.NORMAL)
+        self.update_process_button.config(state=tk.NORMAL)
+        self.remove_process_button.config(state=tk.NORMAL)
+        self.load_trace_button.config(state=tk.NORMAL)
         self.pause_button.config(text="Pause", state=tk.DISABLED)
         self.num_cores_spinbox.config(state=tk.NORMAL)
         self.time_quantum_spinbox.config(state=tk.NORMAL)
@@ -340,7 +1595,7 @@ class RRSchedulerApp:
 
     def start_simulation(self):
         """Starts the scheduling simulation."""
-        if not self.processes:
+        if not self.processes and not self.live_server:
             messagebox.showwarning("No Processes", "Please add at least one process.")
             return
         if self.simulation_running:
@@ -358,14 +1613,27 @@ class RRSchedulerApp:
 
         self.simulation_running = True
         self.simulation_paused = False
-
-        self.processes.sort(key=lambda p: p.arrival_time) # Sort
+        self.run_finished = False
+        self.engine = None
+        if not self.live_server: # Replays the animated schedule headlessly, keeping checkpoints
+            self.engine = RRSimulationEngine(
+                [(p.arrival_time, p.burst_time) for p in self.processes], self.time_quantum, self.num_cores,
+                pids=[p.id for p in self.processes], checkpoint_interval=CHECKPOINT_INTERVAL
+            )
+            self.process_by_id = {p.id: p for p in self.processes}
+
+        self.processes.sort(key=lambda p: (p.arrival_time, p.id)) # Sort
+        self.process_list.invalidate()
         self.terminated_processes = []
         self.ready_queue.clear()
         self.gantt_data = []
+        self._reset_totals()
+        self.pending_arrivals = [(p.arrival_time, p.id, p) for p in self.processes] # Sorted, so a heap
         self.current_time = 0
+        self._reset_gantt_chart()
+        self.live_clock_start = time.monotonic() if self.live_server else None
         self.time_label.config(text="Time: 0")
-        self.results_label.config(text="Simulation running...")
+        self.results_label.config(text="Live ingest running..." if self.live_server else "Simulation running...")
 
         initial_x = 50
         initial_y = QUEUE_AREA_Y_START - 30 # Position
@@ -387,6 +1655,9 @@ class RRSchedulerApp:
 
         self.start_button.config(state=tk.DISABLED)
         self.add_process_button.config(state=tk.DISABLED)
+        self.update_process_button.config(state=tk.DISABLED)
+        self.remove_process_button.config(state=tk.DISABLED)
+        self.load_trace_button.config(state=tk.DISABLED)
         self.pause_button.config(state=tk.NORMAL)
         self.num_cores_spinbox.config(state=tk.DISABLED)
         self.time_quantum_spinbox.config(state=tk.DISABLED)
@@ -395,6 +1666,11 @@ class RRSchedulerApp:
         self.simulasi_langkah()
 
 
+    def _reset_totals(self):
+        self.total_turnaround_time = 0
+        self.terminated_burst_time = 0
+        self.busy_time = 0
+
     def _get_queue_position(self, index):
         """Calculates the visual position for a process in the ready queue."""
         x = 50 + (index * (PROCESS_RADIUS * 2 + 10))
@@ -413,10 +1689,19 @@ class RRSchedulerApp:
             return
 
         start_x, start_y = process.current_x, process.current_y
-        dx = (target_x - start_x) / steps
-        dy = (target_y - start_y) / steps
         process.target_x = target_x
         process.target_y = target_y
+        duration = None # Follows the speed slider
+        budget = self._live_move_budget_ms()
+        if budget is not None and budget < self.get_delay(): # Fit the move into what is left of the step
+            steps = min(steps, budget // 10) # after() waits at least 10 ms per frame
+            duration = budget
+        if steps <= 0: # Behind the wall clock: skip the animation
+            process.set_position(target_x, target_y)
+            if callback: callback()
+            return
+        dx = (target_x - start_x) / steps
+        dy = (target_y - start_y) / steps
 
         def step_move(current_step):
             if self.simulation_paused:
@@ -434,7 +1719,8 @@ class RRSchedulerApp:
                     return
 
                 process.move_visual(dx, dy)
-                self.animation_id = self.master.after(max(10, self.get_delay() // steps), lambda: step_move(current_step + 1))
+                frame_delay = (self.get_delay() if duration is None else duration) // steps
+                self.animation_id = self.master.after(max(10, frame_delay), lambda: step_move(current_step + 1))
             else:
                 process.set_position(target_x, target_y)
                 if callback:
@@ -442,6 +1728,14 @@ class RRSchedulerApp:
 
         step_move(0)
 
+    def _live_move_budget_ms(self):
+        """Returns the milliseconds left until the wall clock reaches the next step in live
+        wallclock mode, which a move must fit into, or None in the other modes."""
+        if not self.live_server or self.live_time_mode != "wallclock":
+            return None
+        due = self.live_clock_start + (self.current_time + 1) / LIVE_TIME_UNITS_PER_S
+        return int((due - time.monotonic()) * 1000)
+
 
     def _update_ready_queue_visuals(self, animated_process=None, target_x=None, target_y=None, callback=None):
         """Rearranges visuals in the ready queue area."""
@@ -449,7 +1743,7 @@ class RRSchedulerApp:
         processes_to_animate = []
 
         processes_in_queue_area = []
-        for p in self.processes:
+        for p in self.ready_queue: # Every "Ready" process is queued by now
             if p.visual_id and p.state == "Ready":
                  if QUEUE_AREA_Y_START < p.current_y < QUEUE_AREA_Y_START + QUEUE_AREA_HEIGHT + PROCESS_RADIUS*2:
                      processes_in_queue_area.append(p)
@@ -494,18 +1788,26 @@ class RRSchedulerApp:
             self.animation_id = self.master.after(200, self.simulasi_langkah)
             return
 
+        if self.live_server:
+            self._admit_live_submissions()
+        else:
+            while not self.engine.finished and self.engine.current_time <= self.current_time:
+                self.engine.step() # Keeps up with the animation, one cheap step at a time
+
+        self._extend_gantt_axis(self.current_time)
+
         current_step_actions = []
 
         newly_arrived = []
-        for process in self.processes:
-            if process.state == "New" and process.arrival_time <= self.current_time:
-                process.state = "Ready"
-                self.ready_queue.append(process)
-                newly_arrived.append(process)
-                initial_x, initial_y = self._get_queue_position(len(self.ready_queue) + 5) # Place
-                initial_y = QUEUE_AREA_Y_START - 30 # Place
-                process.create_visual(initial_x, initial_y)
-                current_step_actions.append({'type': 'arrive', 'process': process})
+        while self.pending_arrivals and self.pending_arrivals[0][0] <= self.current_time:
+            process = heapq.heappop(self.pending_arrivals)[2]
+            process.state = "Ready"
+            self.ready_queue.append(process)
+            newly_arrived.append(process)
+            initial_x, initial_y = self._get_queue_position(len(self.ready_queue) + 5) # Place
+            initial_y = QUEUE_AREA_Y_START - 30 # Place
+            process.create_visual(initial_x, initial_y)
+            current_step_actions.append({'type': 'arrive', 'process': process})
 
 
         cores_freed_this_step = []
@@ -515,10 +1817,7 @@ class RRSchedulerApp:
             if core['state'] == 'Busy':
                 process = core['process']
                 if process: # Should
-                    if self.gantt_data and self.gantt_data[-1][0] == process.id and self.gantt_data[-1][1] == core['id'] and self.gantt_data[-1][3] == self.current_time :
-                         self.gantt_data[-1] = (process.id, core['id'], self.gantt_data[-1][2], self.current_time + 1)
-                    elif not self.gantt_data or self.gantt_data[-1][0] != process.id or self.gantt_data[-1][1] != core['id'] or self.gantt_data[-1][3] != self.current_time:
-                         self.gantt_data.append([process.id, core['id'], self.current_time, self.current_time + 1]) # Start
+                    self._record_gantt_slice(process, core['id'])
 
                     process.remaining_burst_time -= 1
                     process.time_on_core_current_quantum += 1
@@ -527,7 +1826,10 @@ class RRSchedulerApp:
                         process.state = "Terminated"
                         process.completion_time = self.current_time + 1
                         process.turnaround_time = process.completion_time - process.arrival_time
+                        process.waiting_time = process.turnaround_time - process.burst_time
                         self.terminated_processes.append(process)
+                        self.total_turnaround_time += process.turnaround_time
+                        self.terminated_burst_time += process.burst_time
 
                         current_step_actions.append({'type': 'terminate', 'process': process, 'core_id': core['id']})
                         cores_freed_this_step.append(core['id'])
@@ -574,6 +1876,37 @@ class RRSchedulerApp:
         self.execute_animations(current_step_actions, cores_freed_this_step, processes_assigned_this_step)
 
 
+    def _admit_live_submissions(self):
+        """Moves one batch of socket submissions into the process list."""
+        for arrival_time, burst_time in self.live_server.drain(LIVE_INGEST_BATCH_SIZE):
+            if self.live_time_mode == "wallclock":
+                arrival_time = max(self._wallclock_time(), self.current_time) # Later while catching up
+            elif arrival_time is None:
+                arrival_time = self.current_time
+            else:
+                arrival_time = max(arrival_time, self.current_time) # Late timestamps arrive now
+            self.process_counter += 1
+            new_process = Process(self.process_counter, arrival_time, burst_time, self.canvas, self._get_next_color())
+            self.processes.append(new_process)
+            heapq.heappush(self.pending_arrivals, (arrival_time, new_process.id, new_process))
+        self.process_list.refresh()
+
+    def _wallclock_time(self):
+        """Returns the simulated time the wall clock has reached in this live run."""
+        return int((time.monotonic() - self.live_clock_start) * LIVE_TIME_UNITS_PER_S)
+
+    def _next_live_time(self):
+        """Returns the next simulated time. When idle, wallclock mode jumps to the time the wall
+        clock has reached and timestamp mode skips ahead to the next arrival."""
+        next_time = self.current_time + 1
+        if self.ready_queue or any(core['process'] is not None for core in self.cores):
+            return next_time
+        if self.live_time_mode == "wallclock":
+            return max(next_time, self._wallclock_time())
+        if self.pending_arrivals and self.live_server.pending.empty():
+            return max(next_time, self.pending_arrivals[0][0])
+        return next_time
+
     def execute_animations(self, actions, freed_core_ids, assigned_actions_info):
         """ Coordinates and executes the animations for the current time step."""
 
@@ -631,6 +1964,10 @@ class RRSchedulerApp:
         elif arrivals_returns_pending == 0: # No
              pass # Already
 
+        def on_arrival_move_done():
+             on_arrival_return_move_done()
+             on_animation_complete() # Arrivals count towards the step too
+
         def on_arrival_return_move_done():
              nonlocal arrivals_returns_pending
              arrivals_returns_pending -= 1
@@ -649,7 +1986,7 @@ class RRSchedulerApp:
         for action in arrival_actions:
              process = action['process']
              temp_q_x, temp_q_y = self._get_queue_position(len(self.ready_queue)-1) # Approximate
-             self._animate_move(process, temp_q_x, temp_q_y, callback=on_arrival_return_move_done)
+             self._animate_move(process, temp_q_x, temp_q_y, callback=on_arrival_move_done)
 
         for _ in return_actions:
              on_arrival_return_move_done() # Decrement
@@ -671,115 +2008,295 @@ class RRSchedulerApp:
 
     def proceed_to_next_step(self):
         """Checks if simulation is over and schedules the next step."""
-        if len(self.terminated_processes) == len(self.processes):
+        delay = self.get_delay()
+        if self.live_server:
+            self.results_label.config(text=self._format_metrics(live=True))
+            self.current_time = self._next_live_time() # Live runs never end on their own
+            if self.live_time_mode == "wallclock":
+                due = self.live_clock_start + self.current_time / LIVE_TIME_UNITS_PER_S
+                delay = max(0, int((due - time.monotonic()) * 1000)) # 0 while catching up
+        elif len(self.terminated_processes) == len(self.processes):
             self.end_simulation()
             return
+        else:
+            self.current_time += 1
 
-        self.current_time += 1
         self.time_label.config(text=f"Time: {self.current_time}")
 
-        self.animation_id = self.master.after(self.get_delay(), self.simulasi_langkah)
+        self.animation_id = self.master.after(delay, self.simulasi_langkah)
 
 
     def end_simulation(self):
         """Finalizes the simulation and displays results."""
         self.simulation_running = False
+        self.run_finished = True
+        self.engine.run() # Normally finished along with the animation
         self.pause_button.config(state=tk.DISABLED)
         self.reset_button.config(state=tk.NORMAL) # Allow
+        self.add_process_button.config(state=tk.NORMAL) # Edits now re-simulate the finished run
+        self.update_process_button.config(state=tk.NORMAL)
+        self.remove_process_button.config(state=tk.NORMAL)
 
 
         messagebox.showinfo("Simulation Complete", f"Simulation finished at time {self.current_time}.")
 
-        total_waiting_time = 0
-        total_turnaround_time = 0
-        total_burst_time = 0
-        total_busy_time = 0 # Across
-
         if not self.processes: return # Avoid
 
-        for p in self.terminated_processes:
-             p.turnaround_time = p.completion_time - p.arrival_time
-             p.waiting_time = p.turnaround_time - p.burst_time
-             total_waiting_time += p.waiting_time
-             total_turnaround_time += p.turnaround_time
-             total_burst_time += p.burst_time # Sum
+        self.results_label.config(text=self._format_metrics()) # The Gantt chart is already complete
 
-        avg_waiting_time = total_waiting_time / len(self.processes)
-        avg_turnaround_time = total_turnaround_time / len(self.processes)
+    def _compute_metrics(self):
+        """Returns (avg waiting, avg turnaround, CPU utilization %) over the terminated processes.
+        Uses the running totals, so it costs the same however long a live run has been going."""
+        if not self.terminated_processes:
+            return 0, 0, 0
 
-        for entry in self.gantt_data:
-            total_busy_time += (entry[3] - entry[2])
+        total_waiting_time = self.total_turnaround_time - self.terminated_burst_time
+        avg_waiting_time = total_waiting_time / len(self.terminated_processes)
+        avg_turnaround_time = self.total_turnaround_time / len(self.terminated_processes)
 
         if self.current_time > 0 and self.num_cores > 0:
              total_possible_time = self.current_time * self.num_cores
-             cpu_utilization = (total_busy_time / total_possible_time) * 100 if total_possible_time > 0 else 0
+             cpu_utilization = (self.busy_time / total_possible_time) * 100 if total_possible_time > 0 else 0
         else:
              cpu_utilization = 0
 
+        return avg_waiting_time, avg_turnaround_time, cpu_utilization
 
+    def _format_metrics(self, live=False):
+        """Formats the metrics for the results panel."""
+        avg_waiting_time, avg_turnaround_time, cpu_utilization = self._compute_metrics()
         result_text = (
             f"Average Waiting Time: {avg_waiting_time:.2f}\n"
             f"Average Turnaround Time: {avg_turnaround_time:.2f}\n"
             f"CPU Utilization: {cpu_utilization:.2f}%"
         )
-        self.results_label.config(text=result_text)
+        if live:
+            result_text = (
+                f"Live at time {self.current_time}: {len(self.terminated_processes)}/{len(self.processes)} done, "
+                f"{self.live_server.pending.qsize()} queued\n" + result_text
+            )
+        return result_text
 
-        self.draw_gantt_chart()
 
+    def _gantt_axis_y(self):
+        return self.gantt_y_start + (self.num_cores + 0.5) * (GANTT_BAR_HEIGHT + GANTT_PADDING)
 
-    def draw_gantt_chart(self):
-        """Draws the Gantt chart on the canvas."""
+    def _reset_gantt_chart(self):
+        """Clears the Gantt chart and draws its empty frame: core labels and a zero-length time axis."""
         self.canvas.delete("gantt") # Clear
+        self.gantt_open_entries = {} # core_id -> gantt_data entry still being extended
+        self.gantt_bar_items = {} # core_id -> (entry, rect_id, text_id) of the last drawn bar
+        self.gantt_bar_ids = {} # p_id -> {(core_id, start): (rect_id, text_id)} of its bars
+        self.gantt_tick_ids = {} # time -> canvas items of its tick, only for the visible times
+        self.gantt_axis_time = -1 # Last time with a tick
 
-        if not self.gantt_data:
-            return
+        for core_id in range(self.num_cores):
+            y = self.gantt_y_start + core_id * (GANTT_BAR_HEIGHT + GANTT_PADDING)
+            self.canvas.create_text(GANTT_X_START - 10, y + GANTT_BAR_HEIGHT / 2, text=f"C{core_id}", anchor="e", tags="gantt")
+
+        axis_y = self._gantt_axis_y()
+        self.gantt_axis_line = self.canvas.create_line(GANTT_X_START, axis_y, GANTT_X_START, axis_y, tags="gantt")
+        self.gantt_end_label = self.canvas.create_text(GANTT_X_START, axis_y + 10, text="", anchor="n", tags="gantt")
+
+    def _record_gantt_slice(self, process, core_id):
+        """Records one time unit of `process` on `core_id` and extends its bar on the chart."""
+        self.busy_time += 1
+        entry = self.gantt_open_entries.get(core_id)
+        if entry and entry[0] == process.id and entry[3] == self.current_time:
+            entry[3] = self.current_time + 1
+        else:
+            entry = [process.id, core_id, self.current_time, self.current_time + 1] # Start
+            self.gantt_data.append(entry)
+            self.gantt_open_entries[core_id] = entry
+        self._draw_gantt_bar(entry, process.color)
+
+    def _draw_gantt_bar(self, entry, color):
+        """Draws a Gantt bar, or stretches it if it is the bar already drawn last on its core."""
+        p_id, core_id, start, end = entry
+        y = self.gantt_y_start + core_id * (GANTT_BAR_HEIGHT + GANTT_PADDING)
+        x1 = GANTT_X_START + start * GANTT_TIME_SCALE
+        x2 = GANTT_X_START + end * GANTT_TIME_SCALE
+
+        drawn = self.gantt_bar_items.get(core_id)
+        if drawn and drawn[0] is entry:
+            _, rect_id, text_id = drawn
+            self.canvas.coords(rect_id, x1, y, x2, y + GANTT_BAR_HEIGHT)
+        else:
+            selected = self.selected_process is not None and self.selected_process.id == p_id
+            rect_id = self.canvas.create_rectangle(
+                x1, y, x2, y + GANTT_BAR_HEIGHT, fill=color,
+                outline="gold" if selected else "black", width=3 if selected else 1,
+                tags="gantt"
+            )
+            text_id = None
+        if (x2 - x1) > 15: # Only
+            if text_id is None:
+                text_id = self.canvas.create_text((x1 + x2) / 2, y + GANTT_BAR_HEIGHT / 2, text=f"P{p_id}", fill="white", tags="gantt", font=("Arial", 8))
+            else:
+                self.canvas.coords(text_id, (x1 + x2) / 2, y + GANTT_BAR_HEIGHT / 2)
+        self.gantt_bar_items[core_id] = (entry, rect_id, text_id)
+        self.gantt_bar_ids.setdefault(p_id, {})[(core_id, start)] = (rect_id, text_id) # Bars on one core never share a start
 
-        chart_x_start = 50
-        chart_y_start = self.gantt_y_start # Use
-        bar_height = 20
-        time_scale = 15 # Pixels
-        max_time = self.current_time
-        padding = 5
+    def _extend_gantt_axis(self, max_time):
+        """Grows the time axis up to max_time. Ticks are drawn for the visible times only."""
+        if max_time <= self.gantt_axis_time:
+            return
+        end_x = GANTT_X_START + max_time * GANTT_TIME_SCALE
+        previous_end_x = GANTT_X_START + max(self.gantt_axis_time, 0) * GANTT_TIME_SCALE
+        self._set_gantt_axis_end(max_time)
 
-        needed_width = chart_x_start + max_time * time_scale + 50
-        needed_height = chart_y_start + (self.num_cores + 1) * (bar_height + padding) # Add
+        needed_width = end_x + GANTT_TIME_SCALE + 50 # Room for the open bars
+        needed_height = self.gantt_y_start + (self.num_cores + 1) * (GANTT_BAR_HEIGHT + GANTT_PADDING) # Add
         current_scroll_region = list(map(int, self.canvas.cget("scrollregion").split()))
         new_scroll_width = max(current_scroll_region[2], needed_width)
         new_scroll_height = max(current_scroll_region[3], needed_height)
-        self.canvas.config(scrollregion=(0, 0, new_scroll_width, new_scroll_height))
-
-
-        self.canvas.create_line(chart_x_start, chart_y_start + (self.num_cores + 0.5) * (bar_height + padding) ,
-                                chart_x_start + max_time * time_scale, chart_y_start + (self.num_cores + 0.5) * (bar_height + padding),
-                                tags="gantt")
-        for t in range(max_time + 1):
-            x = chart_x_start + t * time_scale
-            self.canvas.create_line(x, chart_y_start + (self.num_cores + 0.5) * (bar_height + padding) - 3,
-                                    x, chart_y_start + (self.num_cores + 0.5) * (bar_height + padding) + 3, tags="gantt")
-            if t % 5 == 0 or t == max_time: # Label
-                 self.canvas.create_text(x, chart_y_start + (self.num_cores + 0.5) * (bar_height + padding) + 10, text=str(t), anchor="n", tags="gantt")
-
-
-        process_map = {p.id: p for p in self.processes} # Map
-
-        for core_id in range(self.num_cores):
-            y = chart_y_start + core_id * (bar_height + padding)
-            self.canvas.create_text(chart_x_start - 10, y + bar_height / 2, text=f"C{core_id}", anchor="e", tags="gantt")
-
-            core_gantt_data = sorted([g for g in self.gantt_data if g[1] == core_id], key=lambda x: x[2]) # Sort
-
-            for entry in core_gantt_data:
-                p_id, _, start, end = entry
-                process = process_map.get(p_id)
-                color = process.color if process else "gray" # Fallback
+        if (new_scroll_width, new_scroll_height) != tuple(current_scroll_region[2:]):
+            self.canvas.config(scrollregion=(0, 0, new_scroll_width, new_scroll_height))
+
+        view_left = self.canvas.canvasx(0)
+        view_right = self.canvas.canvasx(self.canvas.winfo_width())
+        if view_left <= previous_end_x <= view_right < end_x: # Follow the current time
+            self.canvas.xview_moveto(max(0, end_x - (view_right - view_left) * 0.8) / new_scroll_width)
+        self._draw_visible_ticks()
+
+    def _trim_gantt_axis(self, max_time):
+        """Shortens the time axis to max_time, e.g. after an edit ended the run earlier."""
+        if max_time >= self.gantt_axis_time:
+            return
+        self._set_gantt_axis_end(max_time)
+        self._draw_visible_ticks()
+
+    def _on_canvas_xscroll(self, first, last):
+        self.canvas_hbar.set(first, last)
+        self._draw_visible_ticks()
+
+    def _draw_visible_ticks(self):
+        """Keeps tick items for the axis times in view and drops the rest, so a long run or a
+        jump far ahead costs only the ticks that fit on the canvas."""
+        view_left = self.canvas.canvasx(0)
+        view_right = self.canvas.canvasx(self.canvas.winfo_width())
+        first = max(0, math.floor((view_left - GANTT_X_START) / GANTT_TIME_SCALE))
+        last = min(self.gantt_axis_time, math.ceil((view_right - GANTT_X_START) / GANTT_TIME_SCALE))
+        for t in [t for t in self.gantt_tick_ids if not first <= t <= last]:
+            for item in self.gantt_tick_ids.pop(t):
+                self.canvas.delete(item)
+
+        axis_y = self._gantt_axis_y()
+        for t in range(first, last + 1):
+            if t in self.gantt_tick_ids:
+                continue
+            x = GANTT_X_START + t * GANTT_TIME_SCALE
+            tick = [self.canvas.create_line(x, axis_y - 3, x, axis_y + 3, tags="gantt")]
+            if t % 5 == 0: # Label
+                 tick.append(self.canvas.create_text(x, axis_y + 10, text=str(t), anchor="n", tags="gantt"))
+            self.gantt_tick_ids[t] = tick
+
+    def _set_gantt_axis_end(self, max_time):
+        axis_y = self._gantt_axis_y()
+        end_x = GANTT_X_START + max_time * GANTT_TIME_SCALE
+        self.canvas.coords(self.gantt_axis_line, GANTT_X_START, axis_y, end_x, axis_y)
+        self.canvas.coords(self.gantt_end_label, end_x, axis_y + 10) # Always label the current end
+        self.canvas.itemconfig(self.gantt_end_label, text="" if max_time % 5 == 0 else str(max_time))
+        self.gantt_axis_time = max_time
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multicore Round Robin Scheduling Simulator")
+    parser.add_argument("--listen", metavar="ADDRESS",
+                        help="accept live job submissions on 'host:port' or 'unix:/path/to.sock'")
+    parser.add_argument("--time-mode", choices=LIVE_TIME_MODES, default="wallclock",
+                        help="wallclock: time runs with the clock and jobs arrive when received; "
+                             "timestamp: jobs arrive at their arrival_time")
+    parser.add_argument("--export", metavar="OUT",
+                        help="simulate --trace without the GUI and write its Gantt chart to OUT (.svg or .png)")
+    parser.add_argument("--trace", metavar="FILE", help="workload for --export, in the Load Trace format")
+    parser.add_argument("--quantum", type=int, default=2, help="time quantum for --export and --replicate (default: 2)")
+    parser.add_argument("--cores", type=int, default=2, help="number of cores for --export and --replicate (default: 2)")
+    parser.add_argument("--export-width", type=int, default=EXPORT_MAX_WIDTH,
+                        help=f"max chart width in pixels; shorter slices are merged (default: {EXPORT_MAX_WIDTH})")
+    parser.add_argument("--seed", type=int, help="random seed for the GUI color order and --replicate")
+    parser.add_argument("--replicate", action="store_true",
+                        help="run Monte Carlo replications of random workloads and report 95%% confidence intervals")
+    parser.add_argument("--processes", type=int, default=20, help="processes per random workload (default: 20)")
+    parser.add_argument("--max-arrival", type=int, default=50, help="latest random arrival time (default: 50)")
+    parser.add_argument("--burst", type=int, nargs=2, default=(1, 10), metavar=("MIN", "MAX"),
+                        help="random burst time range (default: 1 10)")
+    parser.add_argument("--ci-width", type=float, default=MC_CI_WIDTH,
+                        help=f"stop when every CI is narrower than this fraction of its mean (default: {MC_CI_WIDTH})")
+    parser.add_argument("--max-replications", type=int, default=MC_MAX_REPLICATIONS,
+                        help=f"upper bound on replications (default: {MC_MAX_REPLICATIONS})")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--check-edits", type=int, metavar="N",
+                        help="apply random edits to N random workloads and check each against a full rerun (uses --seed)")
+    args = parser.parse_args(argv)
+
+    if args.check_edits is not None:
+        if args.check_edits < 1:
+            parser.error("--check-edits must be positive")
+        try:
+            checked = check_edits(args.check_edits, args.seed or 0)
+        except AssertionError as e:
+            parser.exit(1, f"Edit check failed: {e}\n")
+        print(f"{checked} edits matched a full rerun")
+        return
+
+    if args.replicate:
+        if args.quantum <= 0 or args.cores <= 0 or args.processes <= 0 or args.max_arrival < 0:
+            parser.error("--quantum, --cores and --processes must be positive and --max-arrival >= 0")
+        if not 0 < args.burst[0] <= args.burst[1]:
+            parser.error("--burst needs 0 < MIN <= MAX")
+        if args.ci_width <= 0 or args.max_replications < 1 or (args.workers is not None and args.workers < 1):
+            parser.error("--ci-width, --max-replications and --workers must be positive")
+        config = {
+            'time_quantum': args.quantum, 'num_cores': args.cores, 'num_processes': args.processes,
+            'max_arrival': args.max_arrival, 'min_burst': args.burst[0], 'max_burst': args.burst[1],
+        }
+        def report(replications, intervals):
+            widths = ", ".join(f"{2 * half / abs(mean):.2%}" if mean else "-" for mean, half in intervals)
+            print(f"{replications} replications, relative CI widths: {widths}", flush=True)
+        replications, intervals, converged = run_replications(
+            config, args.ci_width, args.seed or 0, max_replications=args.max_replications,
+            workers=args.workers, on_batch=report
+        )
+        if converged:
+            print(f"Target CI width reached after {replications} replications:")
+        else:
+            print(f"Target CI width NOT reached: stopped at --max-replications ({replications} replications):")
+        for name, (mean, half) in zip(METRIC_NAMES, intervals):
+            print(f"  {name}: {mean:.3f} \u00b1 {half:.3f} (95% CI)")
+        return
+
+    if args.export:
+        if not args.trace:
+            parser.error("--export needs --trace")
+        if args.quantum <= 0 or args.cores <= 0 or args.export_width < 2:
+            parser.error("--quantum and --cores must be positive and --export-width at least 2")
+        try:
+            workload = list(read_trace(args.trace))
+            engine = export_gantt(workload, args.quantum, args.cores, args.export, args.export_width)
+        except (OSError, ValueError) as e:
+            parser.exit(1, f"Export failed: {e}\n")
+        avg_waiting_time, avg_turnaround_time, cpu_utilization = engine.metrics()
+        print(f"Wrote {args.export}: {len(workload)} processes, finished at time {engine.current_time}, "
+              f"avg waiting {avg_waiting_time:.2f}, avg turnaround {avg_turnaround_time:.2f}, CPU {cpu_utilization:.2f}%")
+        return
+
+    if tk is None:
+        parser.error("the GUI needs tkinter; --export and --replicate run without it")
+    live_server = None
+    if args.listen:
+        try:
+            live_server = LiveIngestServer(args.listen)
+            live_server.start()
+        except (ValueError, OSError) as e:
+            parser.error(f"cannot listen on {args.listen}: {e}")
 
-                x1 = chart_x_start + start * time_scale
-                x2 = chart_x_start + end * time_scale
-                self.canvas.create_rectangle(x1, y, x2, y + bar_height, fill=color, outline="black", tags="gantt")
-                if (x2 - x1) > 15: # Only
-                    self.canvas.create_text((x1 + x2) / 2, y + bar_height / 2, text=f"P{p_id}", fill="white", tags="gantt", font=("Arial", 8))
+    root = tk.Tk()
+    app = RRSchedulerApp(root, live_server=live_server, live_time_mode=args.time_mode, seed=args.seed)
+    try:
+        root.mainloop()
+    finally:
+        if live_server:
+            live_server.stop()
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = RRSchedulerApp(root)
-    root.mainloop()
+    main()